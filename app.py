@@ -1,22 +1,43 @@
 import streamlit as st
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+import functools
 import io
+import os
+import sys
+import time
+import zipfile
+from copy import deepcopy
 from datetime import datetime
 from uuid import uuid4
-from collections import Counter
 
-from PIL import Image
-from PIL.Image import DecompressionBombError
-
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
-from reportlab.platypus import Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
+from session_store import ItemStore, ReportItem, SpillDir, SpilledImage
+from text_metrics import desc_style, fit_text
+
+# python-pptx, Pillow, reportlab and pypdfium2 are imported inside the functions that use them.
+# Streamlit re-executes this script on every interaction, so the editor UI never pays
+# for the rendering stack until a preview is shown or a report is generated.
+RENDER_IMPORT_BUDGET_S = 1.5
+
+# Image bytes + preview pages a session may keep in RAM. Past this, uploaded images are
+# spilled to a per-session temp dir (see enforce_memory_budget). Generated PPT/PDF files
+# are always written there and never held in RAM.
+# Override with the SESSION_MEMORY_BUDGET_MB environment variable.
+SESSION_MEMORY_BUDGET_MB = float(os.environ.get("SESSION_MEMORY_BUDGET_MB", 64))
+
+# Progressive preview shown while a report builds: cover + this many entry pages,
+# laid out with downscaled images and rasterized at a low scale (1.0 = 72 dpi).
+PREVIEW_PAGES = 3
+PREVIEW_IMAGE_PX = 480
+PREVIEW_SCALE = 0.6
+
+# Description text boxes, inner (width, height) in points after padding, per layout.
+# Descriptions are shrunk from the default size down to MIN_DESC_PT to fit (see fit_text).
+PDF_DESC_BOX = {"portrait": (4.0 * 72, 5.0 * 72), "landscape": (8.6 * 72, 1.1 * 72)}
+PPT_DESC_BOX = {"portrait": (4.1 * 72, 5.15 * 72), "landscape": (8.7 * 72, 1.2 * 72)}
+PDF_DESC_PT = {"portrait": 11, "landscape": 11}
+PPT_DESC_PT = {"portrait": 20, "landscape": 18}
+PDF_DESC_LEADING = 14 / 11
+PPT_DESC_LEADING = 1.2
+MIN_DESC_PT = 8
 
 
 # --------------------------------------------------
@@ -30,24 +51,42 @@ st.markdown("---")
 # Session state
 # --------------------------------------------------
 if "report_items" not in st.session_state:
-    st.session_state.report_items = []
-if "generated_ppt_binary" not in st.session_state:
-    st.session_state.generated_ppt_binary = None
+    st.session_state.report_items = ItemStore()
+if "generated_ppt_path" not in st.session_state:
+    st.session_state.generated_ppt_path = None
 if "generated_filename" not in st.session_state:
     st.session_state.generated_filename = ""
-if "generated_pdf_binary" not in st.session_state:
-    st.session_state.generated_pdf_binary = None
+if "generated_pdf_path" not in st.session_state:
+    st.session_state.generated_pdf_path = None
 if "generated_pdf_filename" not in st.session_state:
     st.session_state.generated_pdf_filename = ""
 if "uploader_id" not in st.session_state:
     st.session_state.uploader_id = 0
+# Bumped after the batch / replace-image uploaders are consumed, like uploader_id, so
+# Streamlit drops the uploaded bytes it holds for the old widget.
+if "batch_uploader_id" not in st.session_state:
+    st.session_state.batch_uploader_id = 0
+if "replace_uploader_id" not in st.session_state:
+    st.session_state.replace_uploader_id = 0
 if "debug_log" not in st.session_state:
     st.session_state.debug_log = []
-
-# Ensure stable IDs for all items
-for item in st.session_state.report_items:
-    if "id" not in item:
-        item["id"] = uuid4().hex
+if "spill_dir" not in st.session_state:
+    st.session_state.spill_dir = None
+if "report_set" not in st.session_state:
+    st.session_state.report_set = []
+if "generated_zip_path" not in st.session_state:
+    st.session_state.generated_zip_path = None
+if "generated_zip_filename" not in st.session_state:
+    st.session_state.generated_zip_filename = ""
+if "preview_pages" not in st.session_state:
+    st.session_state.preview_pages = []
+
+# Older sessions kept a plain list of item dicts
+if not isinstance(st.session_state.report_items, ItemStore):
+    st.session_state.report_items = ItemStore(
+        ReportItem(it.get("id") or uuid4().hex, it["category"], it.get("text", ""), it["image"])
+        for it in st.session_state.report_items
+    )
 
 
 # --------------------------------------------------
@@ -58,11 +97,154 @@ def log(msg: str):
     st.session_state.debug_log.append(f"[{ts}] {msg}")
 
 
+def get_spill_dir():
+    if st.session_state.get("spill_dir") is None:
+        st.session_state.spill_dir = SpillDir()
+    return st.session_state.spill_dir
+
+
+def reset_spill_dir():
+    spill_dir = st.session_state.get("spill_dir")
+    if spill_dir is not None:
+        spill_dir.cleanup()
+    st.session_state.spill_dir = None
+
+
+def image_nbytes(image_file):
+    size = getattr(image_file, "size", None)
+    if size is None:
+        size = len(image_file.getvalue())
+    return size
+
+
+def spill_image(image_file):
+    """
+    Write an in-memory upload to the session spill dir and return a SpilledImage for it.
+    """
+    spill_dir = get_spill_dir()
+    ext = os.path.splitext(getattr(image_file, "name", "") or "")[1]
+    path = os.path.join(spill_dir.path, f"{uuid4().hex}{ext}")
+    data = image_file.getvalue()
+    with open(path, "wb") as f:
+        f.write(data)
+    return SpilledImage(spill_dir, path, getattr(image_file, "name", ""), len(data))
+
+
+def release_image(image_file):
+    """
+    Drop the on-disk copy of an image that is no longer referenced by any item.
+    """
+    if isinstance(image_file, SpilledImage):
+        image_file.unlink()
+
+
+def remove_file(path):
+    if path:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def read_file_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def save_generated_file(buf, ext):
+    """
+    Write a generated report to the session spill dir and return its path. Downloads
+    read it back on click (see read_file_bytes), so it's never kept in session_state.
+    """
+    path = os.path.join(get_spill_dir().path, f"report_{uuid4().hex}{ext}")
+    with open(path, "wb") as f:
+        f.write(buf.getbuffer())
+    return path
+
+
+def clear_generated_files():
+    """
+    Invalidate the generated PPT/PDF (and their preview) after the report changes.
+    """
+    remove_file(st.session_state.generated_ppt_path)
+    remove_file(st.session_state.generated_pdf_path)
+    st.session_state.generated_ppt_path = None
+    st.session_state.generated_pdf_path = None
+    st.session_state.preview_pages = []
+
+
+def iter_session_items():
+    """
+    Every item held by the session: the report being edited plus the queued report set.
+    """
+    yield from st.session_state.report_items
+    for spec in st.session_state.report_set:
+        yield from spec["items"]
+
+
+def session_ram_bytes():
+    total = sum(
+        image_nbytes(it.image)
+        for it in iter_session_items()
+        if not isinstance(it.image, SpilledImage)
+    )
+    total += sum(len(png) for png in st.session_state.preview_pages)
+    return total
+
+
+def enforce_memory_budget():
+    """
+    Spill in-memory images to disk, oldest first, until the session fits in
+    SESSION_MEMORY_BUDGET_MB.
+    """
+    budget = SESSION_MEMORY_BUDGET_MB * 1024 * 1024
+    used = session_ram_bytes()
+    if used <= budget:
+        return
+
+    spilled = 0
+    for it in iter_session_items():
+        if used <= budget:
+            break
+        if isinstance(it.image, SpilledImage):
+            continue
+        nbytes = image_nbytes(it.image)
+        it.image = spill_image(it.image)
+        used -= nbytes
+        spilled += 1
+
+    if spilled:
+        log(f"Memory budget exceeded: spilled {spilled} image(s) to disk, ~{used / 1024 / 1024:.1f} MB still in RAM.")
+
+
+def load_renderers():
+    """
+    Import the rendering stack (python-pptx, reportlab, Pillow) on first use and log how
+    long it took against RENDER_IMPORT_BUDGET_S. No-op once they're loaded. pypdfium2 is
+    only needed for the optional preview and is imported by render_pdf_preview.
+    """
+    if "pptx" in sys.modules and "reportlab.pdfgen.canvas" in sys.modules:
+        return
+
+    t0 = time.perf_counter()
+    import pptx  # noqa: F401
+    import PIL.Image  # noqa: F401
+    import reportlab.pdfgen.canvas  # noqa: F401
+    import reportlab.platypus  # noqa: F401
+    elapsed = time.perf_counter() - t0
+
+    msg = f"Renderer imports took {elapsed * 1000:.0f} ms (budget {RENDER_IMPORT_BUDGET_S * 1000:.0f} ms)"
+    log(f"WARNING: {msg}" if elapsed > RENDER_IMPORT_BUDGET_S else msg)
+
+
 def get_image_wh(uploaded_file):
     """
     Return (w, h) and reset pointer so ppt add_picture still works.
     If PIL blocks the image due to huge pixel count, we fallback to a fake landscape size.
     """
+    from PIL import Image
+    from PIL.Image import DecompressionBombError
+
     try:
         try:
             uploaded_file.seek(0)
@@ -84,10 +266,46 @@ def get_image_wh(uploaded_file):
         return 2000, 1000  # fake size -> ratio 2.0
 
 
-def add_border(slide, x, y, w, h, rgb=RGBColor(0, 0, 0), width_pt=1):
+def image_layout(image_file):
+    """
+    "landscape" or "portrait" page layout for an image, same rule as the PPT/PDF builders.
+    """
+    try:
+        w, h = get_image_wh(image_file)
+        ratio = (w / h) if h else 1.0
+    except Exception:
+        ratio = 1.0
+    return "landscape" if ratio >= 1.10 else "portrait"
+
+
+def item_layout(item):
+    """
+    image_layout for a report item, worked out once per image and kept on the item
+    so editor reruns don't reopen every image.
+    """
+    if item.layout is None:
+        item.layout = image_layout(item.image)
+    return item.layout
+
+
+def fit_pdf_desc(text, layout):
+    return fit_text(text, *PDF_DESC_BOX[layout], PDF_DESC_PT[layout], PDF_DESC_LEADING, MIN_DESC_PT)
+
+
+def fit_ppt_desc(text, layout):
+    return fit_text(text, *PPT_DESC_BOX[layout], PPT_DESC_PT[layout], PPT_DESC_LEADING, MIN_DESC_PT)
+
+
+def add_border(slide, x, y, w, h, rgb=None, width_pt=1):
     """
     Reliable border for pictures: draw transparent rectangle over image.
     """
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.util import Pt
+
+    if rgb is None:
+        rgb = RGBColor(0, 0, 0)
     border = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, h)
     border.fill.background()  # transparent fill
     border.line.color.rgb = rgb
@@ -95,11 +313,285 @@ def add_border(slide, x, y, w, h, rgb=RGBColor(0, 0, 0), width_pt=1):
     return border
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def render_cover_pptx(report_title, report_subtitle, report_address, supervisors, counts):
+    """
+    Build a deck holding only the cover slide and return its bytes.
+    Cached by title/subtitle/address/supervisors/category counts, so editing a single
+    finding doesn't rebuild the cover. `counts` is a tuple of (category, n) pairs.
+    """
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+
+    counts_str = ", ".join([f"{v} {k}" for k, v in counts]) or "0 items"
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = report_title
+    slide.placeholders[1].text = report_subtitle
+
+    info_box = slide.shapes.add_textbox(Inches(0.7), Inches(3.4), Inches(8.6), Inches(2.0))
+    tf = info_box.text_frame
+    tf.clear()
+
+    p = tf.paragraphs[0]
+    p.text = f"Address: {report_address}"
+    p.font.size = Pt(16)
+
+    p = tf.add_paragraph()
+    p.text = f"Supervisor(s): {supervisors}"
+    p.font.size = Pt(16)
+
+    p = tf.add_paragraph()
+    p.text = f"Findings: {counts_str}"
+    p.font.size = Pt(16)
+    p.font.bold = True
+
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+class SlideChrome:
+    """
+    Shared slide chrome for one report: background, category header and footer.
+    The first slide builds each piece through python-pptx; every later slide gets a
+    deep copy of that XML with only its text swapped in. Headers are cached per
+    position and size, so a header in a new place is built fresh.
+    """
+
+    def __init__(self, report_title, slide_w, margin, footer_y, footer_h):
+        self.report_title = report_title
+        self.slide_w = slide_w
+        self.margin = margin
+        self.footer_y = footer_y
+        self.footer_h = footer_h
+        self._bg = None
+        self._headers = {}  # (x, y, w, h) -> <p:sp>
+        self._footer = None
+        self._page_box = None
+
+    @staticmethod
+    def _clone(slide, element):
+        # python-pptx has no public API to add an existing shape element; this uses
+        # SlideShapes._next_shape_id and _spTree as in python-pptx 1.0.x.
+        element = deepcopy(element)
+        element.nvSpPr.cNvPr.id = slide.shapes._next_shape_id
+        slide.shapes._spTree.insert_element_before(element, "p:extLst")
+        return slide.shapes[-1]
+
+    def apply_background(self, slide):
+        from pptx.dml.color import RGBColor
+
+        c_sld = slide._element.cSld
+        if self._bg is None:
+            bg = slide.background
+            bg.fill.solid()
+            bg.fill.fore_color.rgb = RGBColor(200, 210, 215)
+            self._bg = c_sld.bg
+        else:
+            c_sld.insert(0, deepcopy(self._bg))
+
+    def add_header(self, slide, x, y, w, h, category):
+        cached = self._headers.get((x, y, w, h))
+        if cached is not None:
+            header = self._clone(slide, cached)
+            header.text_frame.paragraphs[0].text = category
+            return header
+
+        from pptx.dml.color import RGBColor
+        from pptx.enum.shapes import MSO_SHAPE
+        from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+        from pptx.util import Inches, Pt
+
+        header = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, y, w, h)
+        header.fill.solid()
+        header.fill.fore_color.rgb = RGBColor(176, 196, 222)
+        header.line.color.rgb = RGBColor(0, 0, 0)
+        header.text = category
+        header.text_frame.margin_left = Inches(0.2)
+        header.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+        p = header.text_frame.paragraphs[0]
+        p.font.bold = True
+        p.font.size = Pt(26)
+        p.font.color.rgb = RGBColor(0, 0, 0)
+        p.alignment = PP_ALIGN.LEFT
+        self._headers[(x, y, w, h)] = header._element
+        return header
+
+    def add_footer(self, slide, page_no):
+        if self._footer is not None:
+            self._clone(slide, self._footer)
+            page_box = self._clone(slide, self._page_box)
+            page_box.text_frame.paragraphs[0].text = f"Page {page_no}"
+            return
+
+        from pptx.dml.color import RGBColor
+        from pptx.enum.text import PP_ALIGN
+        from pptx.util import Inches, Pt
+
+        M = self.margin
+        footer_box = slide.shapes.add_textbox(M, self.footer_y, Inches(6), self.footer_h)
+        fp = footer_box.text_frame.paragraphs[0]
+        fp.text = self.report_title
+        fp.font.size = Pt(10)
+        fp.font.color.rgb = RGBColor(80, 80, 80)
+
+        page_box = slide.shapes.add_textbox(self.slide_w - M - Inches(2), self.footer_y, Inches(2), self.footer_h)
+        pp = page_box.text_frame.paragraphs[0]
+        pp.text = f"Page {page_no}"
+        pp.font.size = Pt(10)
+        pp.font.color.rgb = RGBColor(80, 80, 80)
+        pp.alignment = PP_ALIGN.RIGHT
+
+        self._footer = footer_box._element
+        self._page_box = page_box._element
+
+
+def build_ppt(report_title, report_subtitle, report_address, supervisors, items, cat_counts):
+    """
+    Build the PPTX deck:
+    - Cover slide (cached, see render_cover_pptx)
+    - One slide per entry, portrait or landscape layout depending on the image ratio
+    """
+    from pptx import Presentation
+    from pptx.dml.color import RGBColor
+    from pptx.enum.shapes import MSO_SHAPE
+    from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+    from pptx.util import Inches, Pt
+
+    cover = render_cover_pptx(
+        report_title, report_subtitle, report_address, supervisors, tuple(cat_counts.items())
+    )
+    prs = Presentation(io.BytesIO(cover))
+
+    # Constants
+    SLIDE_W = Inches(10)
+    SLIDE_H = Inches(7.5)
+    M = Inches(0.5)
+
+    FOOTER_H = Inches(0.50)
+    FOOTER_Y = SLIDE_H - FOOTER_H
+    CONTENT_BOTTOM = FOOTER_Y - Inches(0.15)
+
+    border_color = RGBColor(0, 0, 0)
+    chrome = SlideChrome(report_title, SLIDE_W, M, FOOTER_Y, FOOTER_H)
+
+    for index, item in enumerate(items):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chrome.apply_background(slide)
+
+        try:
+            w, h = get_image_wh(item.image)
+            ratio = (w / h) if h else 1.0
+        except Exception as e:
+            ratio = 1.0
+            log(f"Page {index+1}: ERROR reading image size -> {e}")
+
+        is_landscape = ratio >= 1.10
+        log(f"Page {index+1}: ratio={ratio:.2f}, landscape={is_landscape}")
+
+        if not is_landscape:
+            # Portrait: header+desc left, image right
+            TOP_Y = Inches(0.7)
+            GAP = Inches(0.2)
+            COL = Inches(4.4)
+            HEAD = Inches(0.8)
+            BODY = Inches(5.4)
+            IMG_H = HEAD + BODY
+
+            chrome.add_header(slide, M, TOP_Y, COL, HEAD, item.category)
+
+            desc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, TOP_Y + HEAD, COL, BODY)
+            desc.fill.solid()
+            desc.fill.fore_color.rgb = RGBColor(255, 255, 255)
+            desc.line.color.rgb = border_color
+            desc_text = item.text or ""
+            font_pt, fits = fit_ppt_desc(desc_text, "portrait")
+            if not fits:
+                log(f"Page {index+1}: WARNING description overflows the PPT text box at {font_pt}pt.")
+            tf = desc.text_frame
+            tf.clear()
+            tf.text = desc_text
+            tf.word_wrap = True
+            tf.margin_left = Inches(0.2)
+            tf.margin_top = Inches(0.2)
+            tf.vertical_anchor = MSO_ANCHOR.TOP
+            for p in tf.paragraphs:
+                p.font.size = Pt(font_pt)
+                p.font.color.rgb = RGBColor(0, 0, 0)
+                p.alignment = PP_ALIGN.LEFT
+
+            img_x = M + COL + GAP
+            try:
+                item.image.seek(0)
+            except Exception:
+                pass
+            slide.shapes.add_picture(item.image, img_x, TOP_Y, width=COL, height=IMG_H)
+            add_border(slide, img_x, TOP_Y, COL, IMG_H, rgb=border_color, width_pt=1)
+
+        else:
+            # Landscape: header+desc top, image below
+            TOP_Y = Inches(0.7)
+            FULL_W = SLIDE_W - (M * 2)
+            GAP = Inches(0.2)
+
+            HEAD = Inches(0.8)
+            DESC_H = Inches(1.45)
+
+            chrome.add_header(slide, M, TOP_Y, FULL_W, HEAD, item.category)
+
+            desc_y = TOP_Y + HEAD
+            desc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, desc_y, FULL_W, DESC_H)
+            desc.fill.solid()
+            desc.fill.fore_color.rgb = RGBColor(255, 255, 255)
+            desc.line.color.rgb = border_color
+
+            desc_text = item.text or ""
+            font_pt, fits = fit_ppt_desc(desc_text, "landscape")
+            if not fits:
+                log(f"Page {index+1}: WARNING description overflows the PPT text box at {font_pt}pt.")
+            tf = desc.text_frame
+            tf.clear()
+            tf.text = desc_text
+            tf.word_wrap = True
+            tf.margin_left = Inches(0.2)
+            tf.margin_top = Inches(0.2)
+            tf.vertical_anchor = MSO_ANCHOR.TOP
+            for p in tf.paragraphs:
+                p.font.size = Pt(font_pt)
+                p.font.color.rgb = RGBColor(0, 0, 0)
+                p.alignment = PP_ALIGN.LEFT
+
+            img_y = desc_y + DESC_H + GAP
+            img_h = CONTENT_BOTTOM - img_y
+            if img_h < Inches(2.0):
+                img_h = Inches(2.0)
+
+            try:
+                item.image.seek(0)
+            except Exception:
+                pass
+            slide.shapes.add_picture(item.image, M, img_y, width=FULL_W, height=img_h)
+            add_border(slide, M, img_y, FULL_W, img_h, rgb=border_color, width_pt=1)
+
+        # Footer
+        chrome.add_footer(slide, index + 1)
+
+    ppt_buf = io.BytesIO()
+    prs.save(ppt_buf)
+    ppt_buf.seek(0)
+    return ppt_buf
+
+
 def safe_preview_image(uploaded_file):
     """
     Safely display an uploaded image in Streamlit.
     If Pillow thinks it's too large (DecompressionBombError), show a warning instead of crashing.
     """
+    from PIL import Image
+    from PIL.Image import DecompressionBombError
+
     try:
         try:
             uploaded_file.seek(0)
@@ -114,7 +606,8 @@ def safe_preview_image(uploaded_file):
         except Exception:
             pass
 
-        st.image(uploaded_file, use_container_width=True)
+        source = uploaded_file.path if isinstance(uploaded_file, SpilledImage) else uploaded_file
+        st.image(source, use_container_width=True)
 
     except DecompressionBombError:
         st.warning(
@@ -131,6 +624,11 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
     - Cover page with title/subtitle/address/supervisors/category counts
     - One page per entry with the SAME portrait/landscape layout rules
     """
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Paragraph
+
     buf = io.BytesIO()
 
     # Use the same slide aspect: 10in x 7.5in
@@ -138,11 +636,6 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
     PAGE_H = 7.5 * inch
     c = canvas.Canvas(buf, pagesize=(PAGE_W, PAGE_H))
 
-    styles = getSampleStyleSheet()
-    styleN = styles["Normal"]
-    styleN.fontSize = 11
-    styleN.leading = 14
-
     # -------- Cover page --------
     c.setFont("Helvetica-Bold", 28)
     c.drawString(0.7 * inch, 6.6 * inch, report_title)
@@ -178,7 +671,7 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
 
         # detect landscape
         try:
-            w, h = get_image_wh(item["image"])
+            w, h = get_image_wh(item.image)
             ratio = (w / h) if h else 1.0
         except Exception:
             ratio = 1.0
@@ -200,14 +693,17 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
 
             c.setFillColorRGB(0, 0, 0)
             c.setFont("Helvetica-Bold", 22)
-            c.drawString(M + 0.2*inch, PAGE_H - (TOP_Y + 0.55*inch), item["category"])
+            c.drawString(M + 0.2*inch, PAGE_H - (TOP_Y + 0.55*inch), item.category)
 
             # desc (left)
             c.setFillColorRGB(1, 1, 1)
             c.rect(M, PAGE_H - (TOP_Y + HEAD + BODY), COL, BODY, fill=1, stroke=1)
 
-            desc_text = item.get("text", "") or ""
-            para = Paragraph(desc_text.replace("\n", "<br/>"), styleN)
+            desc_text = item.text or ""
+            font_pt, fits = fit_pdf_desc(desc_text, "portrait")
+            if not fits:
+                log(f"PDF page {idx}: WARNING description overflows the text box at {font_pt}pt.")
+            para = Paragraph(desc_text.replace("\n", "<br/>"), desc_style(font_pt, PDF_DESC_LEADING))
             w_, h_ = para.wrap(COL - 0.4*inch, BODY - 0.4*inch)
             para.drawOn(c, M + 0.2*inch, PAGE_H - (TOP_Y + HEAD + 0.2*inch) - h_)
 
@@ -216,10 +712,10 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
             img_y = PAGE_H - (TOP_Y + IMG_H)
 
             try:
-                item["image"].seek(0)
+                item.image.seek(0)
             except Exception:
                 pass
-            img = ImageReader(item["image"])
+            img = ImageReader(item.image)
             c.drawImage(img, img_x, img_y, width=COL, height=IMG_H, preserveAspectRatio=True, anchor='c')
             c.rect(img_x, img_y, COL, IMG_H, fill=0, stroke=1)
 
@@ -237,15 +733,18 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
 
             c.setFillColorRGB(0, 0, 0)
             c.setFont("Helvetica-Bold", 22)
-            c.drawString(M + 0.2*inch, PAGE_H - (TOP_Y + 0.55*inch), item["category"])
+            c.drawString(M + 0.2*inch, PAGE_H - (TOP_Y + 0.55*inch), item.category)
 
             # desc directly under header
             desc_y_top = TOP_Y + HEAD
             c.setFillColorRGB(1, 1, 1)
             c.rect(M, PAGE_H - (desc_y_top + DESC_H), FULL_W, DESC_H, fill=1, stroke=1)
 
-            desc_text = item.get("text", "") or ""
-            para = Paragraph(desc_text.replace("\n", "<br/>"), styleN)
+            desc_text = item.text or ""
+            font_pt, fits = fit_pdf_desc(desc_text, "landscape")
+            if not fits:
+                log(f"PDF page {idx}: WARNING description overflows the text box at {font_pt}pt.")
+            para = Paragraph(desc_text.replace("\n", "<br/>"), desc_style(font_pt, PDF_DESC_LEADING))
             w_, h_ = para.wrap(FULL_W - 0.4*inch, DESC_H - 0.35*inch)
             para.drawOn(c, M + 0.2*inch, PAGE_H - (desc_y_top + 0.2*inch) - h_)
 
@@ -258,10 +757,10 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
             img_y = PAGE_H - (img_y_top + img_h)
 
             try:
-                item["image"].seek(0)
+                item.image.seek(0)
             except Exception:
                 pass
-            img = ImageReader(item["image"])
+            img = ImageReader(item.image)
             c.drawImage(img, M, img_y, width=FULL_W, height=img_h, preserveAspectRatio=True, anchor='c')
             c.rect(M, img_y, FULL_W, img_h, fill=0, stroke=1)
 
@@ -278,6 +777,89 @@ def build_pdf(report_title, report_subtitle, report_address, supervisors, items,
     return buf
 
 
+def thumbnail_image(image_file, max_px=PREVIEW_IMAGE_PX):
+    """
+    Downscaled JPEG copy of an image for previews (same aspect ratio, so the
+    portrait/landscape layout choice doesn't change). Falls back to the original.
+    """
+    from PIL import Image
+
+    try:
+        image_file.seek(0)
+        with Image.open(image_file) as im:
+            im.draft("RGB", (max_px, max_px))  # cheap JPEG decode at reduced size
+            im = im.convert("RGB")
+            im.thumbnail((max_px, max_px))
+            out = io.BytesIO()
+            im.save(out, format="JPEG", quality=70)
+        out.seek(0)
+        return out
+    except Exception:
+        return image_file
+    finally:
+        try:
+            image_file.seek(0)
+        except Exception:
+            pass
+
+
+def render_pdf_preview(report_title, report_subtitle, report_address, supervisors, items, cat_counts):
+    """
+    PNG previews of the PDF cover and the first PREVIEW_PAGES entry pages.
+    Uses build_pdf on thumbnail images, so it takes seconds even when the full
+    build takes minutes.
+    """
+    import pypdfium2 as pdfium
+
+    preview_items = [it.with_image(thumbnail_image(it.image)) for it in items[:PREVIEW_PAGES]]
+    pdf_buf = build_pdf(report_title, report_subtitle, report_address, supervisors, preview_items, cat_counts)
+
+    pages = []
+    pdf = pdfium.PdfDocument(pdf_buf.getvalue())
+    try:
+        for i in range(len(pdf)):
+            im = pdf[i].render(scale=PREVIEW_SCALE).to_pil()
+            out = io.BytesIO()
+            im.save(out, format="PNG")
+            pages.append(out.getvalue())
+    finally:
+        pdf.close()
+    return pages
+
+
+def show_preview_pages(pages):
+    cols = st.columns(len(pages))
+    for i, (col, png) in enumerate(zip(cols, pages)):
+        with col:
+            st.image(png, caption="Cover" if i == 0 else f"Page {i}", use_container_width=True)
+
+
+def build_report_set_zip(specs, zip_path):
+    """
+    Build the reports in `specs` one at a time and write each PPTX, then PDF, into the
+    ZIP at `zip_path` as soon as it's built, so at most one report file is held in
+    memory. Entries are prefixed with the report's position in the set.
+    If a report fails, the partial ZIP is deleted and the error is re-raised.
+    Sequential on purpose: python-pptx and reportlab are pure Python and hold the GIL,
+    so building on threads was no faster and kept several reports in memory at once.
+    """
+    try:
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zf:
+            for n, spec in enumerate(specs, start=1):
+                try:
+                    cat_counts = spec["items"].category_counts()
+                    args = (spec["title"], spec["subtitle"], spec["address"], spec["supervisors"], spec["items"], cat_counts)
+                    zf.writestr(f"{n:02d}_{spec['ppt_filename']}", build_ppt(*args).getvalue())
+                    zf.writestr(f"{n:02d}_{spec['pdf_filename']}", build_pdf(*args).getvalue())
+                except Exception as e:
+                    log(f"ERROR: report {n}/{len(specs)} ({spec.get('title', '')}) failed -> {e}")
+                    raise
+                log(f"Report {n}/{len(specs)} ({spec['title']}) written to ZIP.")
+    except Exception:
+        remove_file(zip_path)
+        raise
+
+
 # --------------------------------------------------
 # Callbacks
 # --------------------------------------------------
@@ -295,33 +877,27 @@ def add_entry_callback():
         final_cat = "Other"
 
     if uploaded_file and description:
-        st.session_state.report_items.append({
-            "id": uuid4().hex,
-            "category": final_cat,
-            "text": description,
-            "image": uploaded_file
-        })
+        st.session_state.report_items.append(ReportItem(uuid4().hex, final_cat, description, uploaded_file))
         st.session_state["entry_desc"] = ""
         st.session_state.uploader_id += 1
-        st.session_state.generated_ppt_binary = None
-        st.session_state.generated_pdf_binary = None
+        clear_generated_files()
+        enforce_memory_budget()
     else:
         st.error("Please provide both an image and a description.")
 
 
-def delete_item_callback(index):
-    st.session_state.report_items.pop(index)
-    st.session_state.generated_ppt_binary = None
-    st.session_state.generated_pdf_binary = None
+def delete_item_callback(item_id):
+    items = st.session_state.report_items
+    removed = items.pop(items.position(item_id))
+    release_image(removed.image)
+    clear_generated_files()
 
 
 def update_item_text(item_id):
-    for it in st.session_state.report_items:
-        if it["id"] == item_id:
-            it["text"] = (st.session_state.get(f"desc_{item_id}") or "").strip()
-            break
-    st.session_state.generated_ppt_binary = None
-    st.session_state.generated_pdf_binary = None
+    it = st.session_state.report_items.get(item_id)
+    if it is not None:
+        it.text = (st.session_state.get(f"desc_{item_id}") or "").strip()
+    clear_generated_files()
 
 
 def update_item_category(item_id):
@@ -334,23 +910,83 @@ def update_item_category(item_id):
     elif selected == "Other..." and not custom:
         final_cat = "Other"
 
-    for it in st.session_state.report_items:
-        if it["id"] == item_id:
-            it["category"] = final_cat
-            break
-    st.session_state.generated_ppt_binary = None
-    st.session_state.generated_pdf_binary = None
+    if st.session_state.report_items.get(item_id) is not None:
+        st.session_state.report_items.set_category(item_id, final_cat)
+    clear_generated_files()
+
+
+def add_batch_callback():
+    batch_files = st.session_state.get(f"batch_{st.session_state.batch_uploader_id}")
+    if batch_files:
+        for f in batch_files:
+            st.session_state.report_items.append(ReportItem(uuid4().hex, "Exterior", "", f))
+        st.session_state.batch_uploader_id += 1
+        clear_generated_files()
+        enforce_memory_budget()
+        st.success(f"Added {len(batch_files)} images! Scroll down to edit.")
+    else:
+        st.warning("No files selected.")
 
 
 def update_item_image(item_id):
-    uploaded = st.session_state.get(f"img_{item_id}")
+    uploaded = st.session_state.get(f"img_{item_id}_{st.session_state.replace_uploader_id}")
     if uploaded:
-        for it in st.session_state.report_items:
-            if it["id"] == item_id:
-                it["image"] = uploaded
-                break
-        st.session_state.generated_ppt_binary = None
-        st.session_state.generated_pdf_binary = None
+        it = st.session_state.report_items.get(item_id)
+        if it is not None:
+            release_image(it.image)
+            it.image = uploaded
+            it.layout = None
+        st.session_state.replace_uploader_id += 1
+        clear_generated_files()
+        enforce_memory_budget()
+
+
+def clear_report_set_zip():
+    remove_file(st.session_state.generated_zip_path)
+    st.session_state.generated_zip_path = None
+
+
+def add_to_report_set(report_title, report_subtitle, report_address, supervisors, ppt_filename, pdf_filename):
+    """
+    Queue the current report (sidebar settings + entries) for the ZIP export and
+    start a fresh one for the next building.
+    """
+    if not st.session_state.report_items:
+        return
+    st.session_state.report_set.append({
+        "title": report_title,
+        "subtitle": report_subtitle,
+        "address": report_address,
+        "supervisors": supervisors,
+        "ppt_filename": ppt_filename,
+        "pdf_filename": pdf_filename,
+        "items": st.session_state.report_items,
+    })
+    st.session_state.report_items = ItemStore()
+    clear_generated_files()
+    st.session_state.uploader_id += 1
+    clear_report_set_zip()
+
+
+def remove_from_report_set(index):
+    removed = st.session_state.report_set.pop(index)
+    for it in removed["items"]:
+        release_image(it.image)
+    clear_report_set_zip()
+
+
+def clear_report_set():
+    """
+    Drop every queued report and the exported ZIP. The spill dir goes too unless the
+    report being edited still uses it.
+    """
+    for spec in st.session_state.report_set:
+        for it in spec["items"]:
+            release_image(it.image)
+    st.session_state.report_set = []
+    clear_report_set_zip()
+    if not st.session_state.report_items:
+        reset_spill_dir()
 
 
 def move_item(from_index, to_index):
@@ -359,28 +995,30 @@ def move_item(from_index, to_index):
         return
     if to_index < 0 or to_index >= len(items):
         return
-    item = items.pop(from_index)
-    items.insert(to_index, item)
-    st.session_state.generated_ppt_binary = None
-    st.session_state.generated_pdf_binary = None
+    items.move(from_index, to_index)
+    clear_generated_files()
 
 
-def move_up(i):
+def move_up(item_id):
+    i = st.session_state.report_items.position(item_id)
     if i > 0:
         move_item(i, i - 1)
 
 
-def move_down(i):
+def move_down(item_id):
+    i = st.session_state.report_items.position(item_id)
     if i < len(st.session_state.report_items) - 1:
         move_item(i, i + 1)
 
 
-def move_top(i):
+def move_top(item_id):
+    i = st.session_state.report_items.position(item_id)
     if i > 0:
         move_item(i, 0)
 
 
-def move_bottom(i):
+def move_bottom(item_id):
+    i = st.session_state.report_items.position(item_id)
     last = len(st.session_state.report_items) - 1
     if i < last:
         move_item(i, last)
@@ -445,26 +1083,14 @@ with st.sidebar:
 # --------------------------------------------------
 with st.expander("Batch Upload (Add Multiple Images)", expanded=False):
     st.write("Select all images in your folder and drag them here.")
-    batch_files = st.file_uploader(
+    st.file_uploader(
         "Select Multiple Images",
         type=["png", "jpg", "jpeg"],
-        accept_multiple_files=True
+        accept_multiple_files=True,
+        key=f"batch_{st.session_state.batch_uploader_id}",
     )
 
-    if st.button("Add All Batch Images", type="primary"):
-        if batch_files:
-            for f in batch_files:
-                st.session_state.report_items.append({
-                    "id": uuid4().hex,
-                    "category": "Exterior",
-                    "text": "",
-                    "image": f
-                })
-            st.session_state.generated_ppt_binary = None
-            st.session_state.generated_pdf_binary = None
-            st.success(f"Added {len(batch_files)} images! Scroll down to edit.")
-        else:
-            st.warning("No files selected.")
+    st.button("Add All Batch Images", type="primary", on_click=add_batch_callback)
 
 
 # --------------------------------------------------
@@ -496,7 +1122,7 @@ if st.session_state.report_items:
     st.caption("Shown in page order (top = Page 1). Reorder with arrows. Edit everything inline.")
 
     for i, item in enumerate(st.session_state.report_items):
-        item_id = item["id"]
+        item_id = item.id
 
         st.markdown(
             f"""
@@ -519,7 +1145,7 @@ if st.session_state.report_items:
                         font-size:12px;
                         font-weight:800;
                     ">
-                        {item["category"]}
+                        {item.category}
                     </div>
                 </div>
             </div>
@@ -530,11 +1156,11 @@ if st.session_state.report_items:
         col_img, col_fields, col_actions = st.columns([2, 6, 2])
 
         with col_img:
-            safe_preview_image(item["image"])
+            safe_preview_image(item.image)
             st.file_uploader(
                 "Replace image",
                 type=["png", "jpg", "jpeg"],
-                key=f"img_{item_id}",
+                key=f"img_{item_id}_{st.session_state.replace_uploader_id}",
                 on_change=update_item_image,
                 args=(item_id,),
                 label_visibility="collapsed",
@@ -543,7 +1169,7 @@ if st.session_state.report_items:
 
         with col_fields:
             base = ["Exterior", "Interior"]
-            cur_cat = item["category"]
+            cur_cat = item.category
             is_std = cur_cat in base
             default_ix = base.index(cur_cat) if is_std else len(base)
 
@@ -567,7 +1193,7 @@ if st.session_state.report_items:
 
             st.text_area(
                 "Description",
-                value=item.get("text", ""),
+                value=item.text,
                 height=140,
                 key=f"desc_{item_id}",
                 on_change=update_item_text,
@@ -575,13 +1201,26 @@ if st.session_state.report_items:
                 placeholder="Type the observation here...",
             )
 
+            desc_text = item.text or ""
+            if desc_text:
+                layout = item_layout(item)
+                ppt_pt, ppt_fits = fit_ppt_desc(desc_text, layout)
+                pdf_pt, pdf_fits = fit_pdf_desc(desc_text, layout)
+                if not (ppt_fits and pdf_fits):
+                    st.warning(
+                        f"Description is too long for the {layout} page layout and will overflow "
+                        f"its box even at {MIN_DESC_PT}pt. Shorten it before generating."
+                    )
+                elif ppt_pt < PPT_DESC_PT[layout] or pdf_pt < PDF_DESC_PT[layout]:
+                    st.caption(f"Long description: shrunk to {ppt_pt}pt in PPT and {pdf_pt}pt in PDF to fit.")
+
         with col_actions:
-            st.button("Top", key=f"top_{item_id}", on_click=move_top, args=(i,), use_container_width=True, disabled=(i == 0))
-            st.button("Up", key=f"up_{item_id}", on_click=move_up, args=(i,), use_container_width=True, disabled=(i == 0))
-            st.button("Down", key=f"down_{item_id}", on_click=move_down, args=(i,), use_container_width=True, disabled=(i == len(st.session_state.report_items) - 1))
-            st.button("Bottom", key=f"bottom_{item_id}", on_click=move_bottom, args=(i,), use_container_width=True, disabled=(i == len(st.session_state.report_items) - 1))
+            st.button("Top", key=f"top_{item_id}", on_click=move_top, args=(item_id,), use_container_width=True, disabled=(i == 0))
+            st.button("Up", key=f"up_{item_id}", on_click=move_up, args=(item_id,), use_container_width=True, disabled=(i == 0))
+            st.button("Down", key=f"down_{item_id}", on_click=move_down, args=(item_id,), use_container_width=True, disabled=(i == len(st.session_state.report_items) - 1))
+            st.button("Bottom", key=f"bottom_{item_id}", on_click=move_bottom, args=(item_id,), use_container_width=True, disabled=(i == len(st.session_state.report_items) - 1))
             st.divider()
-            st.button("Delete", key=f"delete_{item_id}", on_click=delete_item_callback, args=(i,), use_container_width=True)
+            st.button("Delete", key=f"delete_{item_id}", on_click=delete_item_callback, args=(item_id,), use_container_width=True)
 
         st.divider()
 
@@ -605,209 +1244,76 @@ if debug_mode:
 # Generate PPT + PDF
 # --------------------------------------------------
 if st.session_state.report_items:
-    if st.session_state.generated_ppt_binary is None:
+    if st.session_state.generated_ppt_path is None:
         if st.button("Generate Report", type="primary", use_container_width=True):
             st.session_state.debug_log = []
             log("Starting report generation...")
+            load_renderers()
 
             # Category counts
-            cat_counts = Counter([it["category"] for it in st.session_state.report_items])
+            cat_counts = st.session_state.report_items.category_counts()
             counts_str = ", ".join([f"{v} {k}" for k, v in cat_counts.items()]) or "0 items"
             log(f"Category counts: {counts_str}")
 
-            # ---------------- PPT BUILD ----------------
-            prs = Presentation()
-
-            # Title slide
-            slide = prs.slides.add_slide(prs.slide_layouts[0])
-            slide.shapes.title.text = report_title
-            slide.placeholders[1].text = report_subtitle
-
-            info_box = slide.shapes.add_textbox(Inches(0.7), Inches(3.4), Inches(8.6), Inches(2.0))
-            tf = info_box.text_frame
-            tf.clear()
-
-            p = tf.paragraphs[0]
-            p.text = f"Address: {report_address}"
-            p.font.size = Pt(16)
-
-            p = tf.add_paragraph()
-            p.text = f"Supervisor(s): {supervisors}"
-            p.font.size = Pt(16)
-
-            p = tf.add_paragraph()
-            p.text = f"Findings: {counts_str}"
-            p.font.size = Pt(16)
-            p.font.bold = True
-
-            # Constants
-            SLIDE_W = Inches(10)
-            SLIDE_H = Inches(7.5)
-            M = Inches(0.5)
-
-            FOOTER_H = Inches(0.50)
-            FOOTER_Y = SLIDE_H - FOOTER_H
-            CONTENT_BOTTOM = FOOTER_Y - Inches(0.15)
-
-            header_color = RGBColor(176, 196, 222)
-            border_color = RGBColor(0, 0, 0)
-
-            for index, item in enumerate(st.session_state.report_items):
-                slide = prs.slides.add_slide(prs.slide_layouts[6])
-
-                bg = slide.background
-                bg.fill.solid()
-                bg.fill.fore_color.rgb = RGBColor(200, 210, 215)
-
-                try:
-                    w, h = get_image_wh(item["image"])
-                    ratio = (w / h) if h else 1.0
-                except Exception as e:
-                    ratio = 1.0
-                    log(f"Page {index+1}: ERROR reading image size -> {e}")
-
-                is_landscape = ratio >= 1.10
-                log(f"Page {index+1}: ratio={ratio:.2f}, landscape={is_landscape}")
-
-                if not is_landscape:
-                    # Portrait: header+desc left, image right
-                    TOP_Y = Inches(0.7)
-                    GAP = Inches(0.2)
-                    COL = Inches(4.4)
-                    HEAD = Inches(0.8)
-                    BODY = Inches(5.4)
-                    IMG_H = HEAD + BODY
-
-                    header = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, TOP_Y, COL, HEAD)
-                    header.fill.solid()
-                    header.fill.fore_color.rgb = header_color
-                    header.line.color.rgb = border_color
-                    header.text = item["category"]
-                    header.text_frame.margin_left = Inches(0.2)
-                    header.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-                    p = header.text_frame.paragraphs[0]
-                    p.font.bold = True
-                    p.font.size = Pt(26)
-                    p.font.color.rgb = RGBColor(0, 0, 0)
-                    p.alignment = PP_ALIGN.LEFT
-
-                    desc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, TOP_Y + HEAD, COL, BODY)
-                    desc.fill.solid()
-                    desc.fill.fore_color.rgb = RGBColor(255, 255, 255)
-                    desc.line.color.rgb = border_color
-                    tf = desc.text_frame
-                    tf.clear()
-                    tf.text = item.get("text", "")
-                    tf.word_wrap = True
-                    tf.margin_left = Inches(0.2)
-                    tf.margin_top = Inches(0.2)
-                    tf.vertical_anchor = MSO_ANCHOR.TOP
-                    p = tf.paragraphs[0]
-                    p.font.size = Pt(20)
-                    p.font.color.rgb = RGBColor(0, 0, 0)
-                    p.alignment = PP_ALIGN.LEFT
-
-                    img_x = M + COL + GAP
-                    try:
-                        item["image"].seek(0)
-                    except Exception:
-                        pass
-                    slide.shapes.add_picture(item["image"], img_x, TOP_Y, width=COL, height=IMG_H)
-                    add_border(slide, img_x, TOP_Y, COL, IMG_H, rgb=border_color, width_pt=1)
+            # ---------------- QUICK PREVIEW ----------------
+            # Shown right away (Streamlit streams elements as the script runs), so a wrong
+            # category on page 2 is visible before the full build below finishes.
+            st.session_state.preview_pages = []
+            try:
+                st.session_state.preview_pages = render_pdf_preview(
+                    report_title,
+                    report_subtitle,
+                    report_address,
+                    supervisors,
+                    st.session_state.report_items,
+                    cat_counts
+                )
+                log(f"Preview of {len(st.session_state.preview_pages)} page(s) ready.")
+            except Exception as e:
+                log(f"WARNING: preview failed -> {e}")
+
+            if st.session_state.preview_pages:
+                st.caption("Preview (low resolution). The full report is still building...")
+                show_preview_pages(st.session_state.preview_pages)
+
+            with st.spinner("Building full PPT and PDF..."):
+                # ---------------- PPT BUILD ----------------
+                ppt_buf = build_ppt(
+                    report_title,
+                    report_subtitle,
+                    report_address,
+                    supervisors,
+                    st.session_state.report_items,
+                    cat_counts
+                )
 
-                else:
-                    # Landscape: header+desc top, image below
-                    TOP_Y = Inches(0.7)
-                    FULL_W = SLIDE_W - (M * 2)
-                    GAP = Inches(0.2)
-
-                    HEAD = Inches(0.8)
-                    DESC_H = Inches(1.45)
-
-                    header = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, TOP_Y, FULL_W, HEAD)
-                    header.fill.solid()
-                    header.fill.fore_color.rgb = header_color
-                    header.line.color.rgb = border_color
-                    header.text = item["category"]
-                    header.text_frame.margin_left = Inches(0.2)
-                    header.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-                    p = header.text_frame.paragraphs[0]
-                    p.font.bold = True
-                    p.font.size = Pt(26)
-                    p.font.color.rgb = RGBColor(0, 0, 0)
-                    p.alignment = PP_ALIGN.LEFT
-
-                    desc_y = TOP_Y + HEAD
-                    desc = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, M, desc_y, FULL_W, DESC_H)
-                    desc.fill.solid()
-                    desc.fill.fore_color.rgb = RGBColor(255, 255, 255)
-                    desc.line.color.rgb = border_color
-
-                    tf = desc.text_frame
-                    tf.clear()
-                    tf.text = item.get("text", "")
-                    tf.word_wrap = True
-                    tf.margin_left = Inches(0.2)
-                    tf.margin_top = Inches(0.2)
-                    tf.vertical_anchor = MSO_ANCHOR.TOP
-                    p = tf.paragraphs[0]
-                    p.font.size = Pt(18)
-                    p.font.color.rgb = RGBColor(0, 0, 0)
-                    p.alignment = PP_ALIGN.LEFT
-
-                    img_y = desc_y + DESC_H + GAP
-                    img_h = CONTENT_BOTTOM - img_y
-                    if img_h < Inches(2.0):
-                        img_h = Inches(2.0)
-
-                    try:
-                        item["image"].seek(0)
-                    except Exception:
-                        pass
-                    slide.shapes.add_picture(item["image"], M, img_y, width=FULL_W, height=img_h)
-                    add_border(slide, M, img_y, FULL_W, img_h, rgb=border_color, width_pt=1)
-
-                # Footer
-                footer_box = slide.shapes.add_textbox(M, FOOTER_Y, Inches(6), FOOTER_H)
-                fp = footer_box.text_frame.paragraphs[0]
-                fp.text = report_title
-                fp.font.size = Pt(10)
-                fp.font.color.rgb = RGBColor(80, 80, 80)
-
-                page_box = slide.shapes.add_textbox(SLIDE_W - M - Inches(2), FOOTER_Y, Inches(2), FOOTER_H)
-                pp = page_box.text_frame.paragraphs[0]
-                pp.text = f"Page {index + 1}"
-                pp.font.size = Pt(10)
-                pp.font.color.rgb = RGBColor(80, 80, 80)
-                pp.alignment = PP_ALIGN.RIGHT
-
-            ppt_buf = io.BytesIO()
-            prs.save(ppt_buf)
-            ppt_buf.seek(0)
-
-            st.session_state.generated_ppt_binary = ppt_buf
-            st.session_state.generated_filename = final_filename
-            log("PPT generation complete.")
-
-            # ---------------- PDF BUILD ----------------
-            pdf_buf = build_pdf(
-                report_title,
-                report_subtitle,
-                report_address,
-                supervisors,
-                st.session_state.report_items,
-                cat_counts
-            )
-            st.session_state.generated_pdf_binary = pdf_buf
-            st.session_state.generated_pdf_filename = final_pdf_filename
-            log("PDF generation complete.")
+                st.session_state.generated_ppt_path = save_generated_file(ppt_buf, ".pptx")
+                st.session_state.generated_filename = final_filename
+                del ppt_buf
+                log("PPT generation complete.")
+
+                # ---------------- PDF BUILD ----------------
+                pdf_buf = build_pdf(
+                    report_title,
+                    report_subtitle,
+                    report_address,
+                    supervisors,
+                    st.session_state.report_items,
+                    cat_counts
+                )
+                st.session_state.generated_pdf_path = save_generated_file(pdf_buf, ".pdf")
+                st.session_state.generated_pdf_filename = final_pdf_filename
+                del pdf_buf
+                log("PDF generation complete.")
+            enforce_memory_budget()
 
             st.rerun()
 
     else:
+        # Deferred like the report set ZIP: files are read from disk only on click.
         st.download_button(
             label=f"Download {st.session_state.generated_filename}",
-            data=st.session_state.generated_ppt_binary,
+            data=functools.partial(read_file_bytes, st.session_state.generated_ppt_path),
             file_name=st.session_state.generated_filename,
             mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             type="primary",
@@ -816,16 +1322,79 @@ if st.session_state.report_items:
 
         st.download_button(
             label=f"Download {st.session_state.generated_pdf_filename}",
-            data=st.session_state.generated_pdf_binary,
+            data=functools.partial(read_file_bytes, st.session_state.generated_pdf_path),
             file_name=st.session_state.generated_pdf_filename,
             mime="application/pdf",
             type="secondary",
             use_container_width=True,
         )
 
+        if st.session_state.preview_pages:
+            with st.expander("Preview (first pages)", expanded=False):
+                show_preview_pages(st.session_state.preview_pages)
+
         if st.button("Reset / Start New Report", use_container_width=True):
-            st.session_state.report_items = []
-            st.session_state.generated_ppt_binary = None
-            st.session_state.generated_pdf_binary = None
+            for it in st.session_state.report_items:
+                release_image(it.image)
+            st.session_state.report_items = ItemStore()
+            clear_generated_files()
             st.session_state.uploader_id += 1
+            if not st.session_state.report_set:
+                reset_spill_dir()
             st.rerun()
+
+
+# --------------------------------------------------
+# Report set (multi-report ZIP export)
+# --------------------------------------------------
+st.markdown("---")
+with st.expander(f"Report Set ({len(st.session_state.report_set)} queued)", expanded=bool(st.session_state.report_set)):
+    st.write(
+        "Inspecting several buildings? Queue the current report (sidebar settings + entries), "
+        "start the next one, then export every PPTX and PDF as a single ZIP."
+    )
+    st.button(
+        "Add Current Report to Set",
+        on_click=add_to_report_set,
+        args=(report_title, report_subtitle, report_address, supervisors, final_filename, final_pdf_filename),
+        disabled=not st.session_state.report_items,
+        use_container_width=True,
+    )
+
+    for n, spec in enumerate(st.session_state.report_set):
+        c_info, c_remove = st.columns([8, 2])
+        with c_info:
+            st.markdown(f"**{n + 1}. {spec['title']}** — {spec['address']} ({len(spec['items'])} entries)")
+        with c_remove:
+            st.button("Remove", key=f"set_remove_{n}", on_click=remove_from_report_set, args=(n,), use_container_width=True)
+
+    if st.session_state.report_set:
+        st.button("Clear Set", on_click=clear_report_set, use_container_width=True)
+        if st.session_state.generated_zip_path is None:
+            if st.button("Export Set as ZIP", type="primary", use_container_width=True):
+                st.session_state.debug_log = []
+                log(f"Starting report set export ({len(st.session_state.report_set)} reports)...")
+                load_renderers()
+
+                zip_path = os.path.join(get_spill_dir().path, f"report_set_{uuid4().hex}.zip")
+                try:
+                    with st.spinner("Building reports..."):
+                        build_report_set_zip(st.session_state.report_set, zip_path)
+                except Exception as e:
+                    st.error(f"Report set export failed: {e}. See the debug log for which report.")
+                else:
+                    st.session_state.generated_zip_path = zip_path
+                    st.session_state.generated_zip_filename = f"Report_Set_{filename_suffix}.zip"
+                    log("Report set export complete.")
+                    st.rerun()
+        else:
+            # Deferred: the ZIP is only read when the button is clicked, not on every
+            # rerun that shows it.
+            st.download_button(
+                label=f"Download {st.session_state.generated_zip_filename}",
+                data=functools.partial(read_file_bytes, st.session_state.generated_zip_path),
+                file_name=st.session_state.generated_zip_filename,
+                mime="application/zip",
+                type="primary",
+                use_container_width=True,
+            )
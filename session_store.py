@@ -0,0 +1,191 @@
+"""
+Objects kept in st.session_state across reruns: spilled image handles and the report item store.
+
+They live outside app.py because Streamlit re-executes the script on every rerun:
+classes defined there are new objects each time, so isinstance checks against
+instances created on an earlier run would fail.
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import weakref
+
+
+class SpillDir:
+    """
+    Per-session temp dir holding spilled image bytes.
+    Removed on reset, or when the session state holding it is garbage collected
+    (session expiry) and at interpreter exit.
+    """
+
+    def __init__(self):
+        self.path = tempfile.mkdtemp(prefix="inspection_report_")
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    def cleanup(self):
+        self._finalizer()
+
+
+class SpilledImage:
+    """
+    Read-only file-like handle over an image spilled to disk.
+    Supports read/seek/tell like UploadedFile, so PIL, python-pptx and reportlab can use
+    it as-is. The file is only opened for the duration of each read, so thousands of
+    spilled images don't hold thousands of file descriptors.
+    """
+
+    def __init__(self, spill_dir, path, name, size):
+        self._spill_dir = spill_dir  # keeps the dir alive while this handle exists
+        self.path = path
+        self.name = name
+        self.size = size
+        self._pos = 0
+
+    def read(self, n=-1):
+        with open(self.path, "rb") as f:
+            f.seek(self._pos)
+            data = f.read(n)
+        self._pos += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def getvalue(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def close(self):
+        # No file is held open between reads. reportlab's ImageReader closes the
+        # handles it's given, and the item still needs this one for later builds.
+        pass
+
+    def unlink(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class ReportItem:
+    """
+    One finding (one page). Category names are interned, so thousands of items
+    share a handful of string objects. Change the category through
+    ItemStore.set_category so the store's counts stay right.
+    `layout` caches the page layout worked out from the image ("portrait" or
+    "landscape"); None until first needed. Reset it when the image is replaced.
+    """
+
+    __slots__ = ("id", "category", "text", "image", "layout")
+
+    def __init__(self, item_id, category, text, image, layout=None):
+        self.id = item_id
+        self.category = sys.intern(category)
+        self.text = text
+        self.image = image
+        self.layout = layout
+
+    def with_image(self, image):
+        # Same picture (e.g. a thumbnail or spilled copy), so the layout carries over.
+        return ReportItem(self.id, self.category, self.text, image, self.layout)
+
+
+class ItemStore:
+    """
+    Report items in page order, with O(1) lookup by id and category counts kept
+    up to date on every change (no rescans per rerun).
+    The id -> position index is updated in place on append and adjacent moves.
+    Deletes and moves to top/bottom mark it stale, and the next position lookup
+    rebuilds it in O(n); reordering itself is a list insert/pop, also O(n).
+    """
+
+    def __init__(self, items=()):
+        self._order = []   # ReportItem, page order
+        self._by_id = {}   # id -> ReportItem
+        self._pos = {}     # id -> index into _order, valid unless _pos_stale
+        self._pos_stale = False
+        self._counts = {}  # category -> count
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __iter__(self):
+        return iter(self._order)
+
+    def __getitem__(self, index):
+        return self._order[index]
+
+    def get(self, item_id):
+        return self._by_id.get(item_id)
+
+    def position(self, item_id):
+        if self._pos_stale:
+            self._pos = {item.id: i for i, item in enumerate(self._order)}
+            self._pos_stale = False
+        return self._pos[item_id]
+
+    def category_counts(self):
+        """
+        {category: count} ordered by each category's first page, as the cover lists
+        them. Walks the pages only until every category has been seen.
+        """
+        counts = {}
+        for item in self._order:
+            if item.category not in counts:
+                counts[item.category] = self._counts[item.category]
+                if len(counts) == len(self._counts):
+                    break
+        return counts
+
+    def _count(self, category, delta):
+        n = self._counts.get(category, 0) + delta
+        if n:
+            self._counts[category] = n
+        else:
+            self._counts.pop(category, None)
+
+    def append(self, item):
+        if not self._pos_stale:
+            self._pos[item.id] = len(self._order)
+        self._order.append(item)
+        self._by_id[item.id] = item
+        self._count(item.category, 1)
+
+    def pop(self, index):
+        item = self._order.pop(index)
+        del self._by_id[item.id]
+        self._pos.pop(item.id, None)
+        self._pos_stale = self._pos_stale or index < len(self._order)
+        self._count(item.category, -1)
+        return item
+
+    def move(self, from_index, to_index):
+        order = self._order
+        if abs(from_index - to_index) == 1:
+            order[from_index], order[to_index] = order[to_index], order[from_index]
+            if not self._pos_stale:
+                self._pos[order[from_index].id] = from_index
+                self._pos[order[to_index].id] = to_index
+        elif from_index != to_index:
+            order.insert(to_index, order.pop(from_index))
+            self._pos_stale = True
+
+    def set_category(self, item_id, category):
+        item = self._by_id[item_id]
+        category = sys.intern(category)
+        if category != item.category:
+            self._count(item.category, -1)
+            self._count(category, 1)
+            item.category = category
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# app.py imports session_store from the repo root (Streamlit puts the script dir on sys.path).
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
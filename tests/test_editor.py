@@ -0,0 +1,91 @@
+import io
+import os
+import subprocess
+import sys
+
+from PIL import Image
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_DIR
+from text_metrics import helvetica_width
+
+APP_PATH = os.path.join(REPO_DIR, "app.py")
+
+EDITOR_RUN = """
+import io, sys
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+from session_store import ItemStore, ReportItem
+
+def jpeg(w, h):
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h)).save(buf, format="JPEG")
+    buf.name, buf.size = "a.jpg", buf.tell()
+    return buf
+
+at = AppTest.from_file("app.py", default_timeout=60)
+at.run()
+at.session_state.report_items = ItemStore(
+    ReportItem(f"i{i}", "Exterior", "Long finding. " * 400, jpeg(w, h))
+    for i, (w, h) in enumerate([(600, 400), (400, 600)])
+)
+at.run()
+at.text_area(key="desc_i0").set_value("Edited finding").run()
+assert not at.exception, at.exception
+assert at.warning, "overflow warning missing"
+print(sorted(m for m in sys.modules if m.split(".")[0] in ("reportlab", "pptx", "pypdfium2")))
+"""
+
+
+def test_helvetica_widths_match_reportlab():
+    text = "Crack (2.5 mm) in NE wall – see “Photo 3”; façade ÉTÉ 100% ok…"
+    assert abs(helvetica_width(text, 11) - stringWidth(text, "Helvetica", 11)) < 1e-6
+
+
+def test_editor_does_not_load_renderers():
+    # Fresh interpreter: other tests in this process have already imported reportlab.
+    out = subprocess.run(
+        [sys.executable, "-c", EDITOR_RUN], cwd=REPO_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip().splitlines()[-1] == "[]"
+
+
+def jpeg_bytes(w, h):
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h)).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def test_layout_is_cached_until_image_is_replaced():
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    at.file_uploader(key="batch_0").set_value([("p.jpg", jpeg_bytes(60, 40), "image/jpeg")]).run()
+    next(b for b in at.button if b.label == "Add All Batch Images").click().run()
+    item_id = at.session_state.report_items[0].id
+    at.text_area(key=f"desc_{item_id}").set_value("Finding").run()
+    assert at.session_state.report_items[0].layout == "landscape"
+
+    at.file_uploader(key=f"img_{item_id}_0").set_value(("q.jpg", jpeg_bytes(40, 60), "image/jpeg")).run()
+    assert not at.exception
+    assert at.session_state.report_items[0].layout == "portrait"
+
+
+def test_descriptions_are_not_remeasured_on_rerun():
+    import text_metrics
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    texts = [f"Unique finding {n} for the rerun test. " * 20 for n in range(5)]
+    at.file_uploader(key="batch_0").set_value(
+        [(f"p{n}.jpg", jpeg_bytes(60, 40), "image/jpeg") for n in range(5)]
+    ).run()
+    next(b for b in at.button if b.label == "Add All Batch Images").click().run()
+    for item, text in zip(at.session_state.report_items, texts):
+        at.text_area(key=f"desc_{item.id}").set_value(text)
+    at.run()
+
+    misses = text_metrics.fit_text.cache_info().misses
+    at.run()
+    at.run()
+    assert text_metrics.fit_text.cache_info().misses == misses
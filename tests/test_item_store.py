@@ -0,0 +1,43 @@
+import random
+
+from session_store import ItemStore, ReportItem
+
+
+def test_category_counts_follow_page_order():
+    store = ItemStore([ReportItem("a", "Exterior", "", None), ReportItem("b", "Interior", "", None)])
+    store.set_category("a", "Interior")
+    store.set_category("a", "Exterior")
+    assert list(store.category_counts().items()) == [("Exterior", 1), ("Interior", 1)]
+
+    store.move(1, 0)
+    assert list(store.category_counts()) == ["Interior", "Exterior"]
+
+
+def test_matches_plain_list():
+    rng = random.Random(33)
+    store, ref = ItemStore(), []
+    for step in range(3000):
+        op = rng.randrange(4)
+        if op == 0 or not ref:
+            item = ReportItem(f"i{step}", rng.choice("ABC"), "", None)
+            store.append(item)
+            ref.append(item)
+        elif op == 1:
+            i = rng.randrange(len(ref))
+            assert store.pop(i) is ref.pop(i)
+        elif op == 2:
+            i, j = rng.randrange(len(ref)), rng.randrange(len(ref))
+            store.move(i, j)
+            ref.insert(j, ref.pop(i))
+        else:
+            item = rng.choice(ref)
+            store.set_category(item.id, rng.choice("ABC"))
+
+        assert list(store) == ref
+        if ref:
+            probe = rng.choice(ref)
+            assert store.position(probe.id) == ref.index(probe)
+        expected = {}
+        for item in ref:
+            expected[item.category] = expected.get(item.category, 0) + 1
+        assert list(store.category_counts().items()) == list(expected.items())
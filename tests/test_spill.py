@@ -0,0 +1,163 @@
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_DIR
+from session_store import ItemStore, ReportItem, SpillDir, SpilledImage
+
+APP_PATH = os.path.join(REPO_DIR, "app.py")
+
+
+@pytest.fixture
+def spill_dir():
+    d = SpillDir()
+    yield d
+    d.cleanup()
+
+
+def spilled_jpeg(spill_dir, name, w, h):
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h), "green").save(buf, format="JPEG")
+    path = os.path.join(spill_dir.path, name)
+    with open(path, "wb") as f:
+        f.write(buf.getvalue())
+    return SpilledImage(spill_dir, path, name, len(buf.getvalue()))
+
+
+def spilled_items(spill_dir, prefix):
+    # One landscape and one portrait page.
+    return ItemStore(
+        ReportItem(f"{prefix}{i}", "Exterior", f"Finding {i}", spilled_jpeg(spill_dir, f"{prefix}{i}.jpg", w, h))
+        for i, (w, h) in enumerate([(600, 400), (400, 600)])
+    )
+
+
+def file_head(path, n):
+    with open(path, "rb") as f:
+        return f.read(n)
+
+
+def click(at, label):
+    next(b for b in at.button if b.label == label).click().run()
+    assert not at.exception, [e.value for e in at.exception]
+
+
+def test_spilled_image_reads_like_a_file(spill_dir):
+    img = spilled_jpeg(spill_dir, "a.jpg", 30, 20)
+    data = img.getvalue()
+    assert img.read(4) == data[:4]
+    assert img.tell() == 4
+    img.seek(-2, io.SEEK_END)
+    assert img.read() == data[-2:]
+    img.close()  # reportlab closes handles it's given; the image must stay readable
+    img.seek(0)
+    assert img.read() == data
+
+
+def test_generate_with_spilled_images_twice(spill_dir):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    at.session_state.report_items = spilled_items(spill_dir, "i")
+    at.run()
+
+    click(at, "Generate Report")
+    assert file_head(at.session_state.generated_ppt_path, 2) == b"PK"
+    assert file_head(at.session_state.generated_pdf_path, 4) == b"%PDF"
+    first_pdf = at.session_state.generated_pdf_path
+
+    at.text_area(key="desc_i0").set_value("Edited finding").run()
+    assert at.session_state.generated_ppt_path is None
+    assert not os.path.exists(first_pdf)
+    click(at, "Generate Report")
+    assert file_head(at.session_state.generated_pdf_path, 4) == b"%PDF"
+
+
+def test_generate_without_pypdfium2(spill_dir, monkeypatch):
+    # pypdfium2 only drives the optional preview; a missing package mustn't block Generate.
+    monkeypatch.setitem(sys.modules, "pypdfium2", None)
+    monkeypatch.delitem(sys.modules, "pptx", raising=False)  # so load_renderers runs its imports
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    at.session_state.report_items = spilled_items(spill_dir, "i")
+    at.run()
+
+    click(at, "Generate Report")
+    assert file_head(at.session_state.generated_pdf_path, 4) == b"%PDF"
+    assert at.session_state.preview_pages == []
+
+
+def test_export_set_with_spilled_images(spill_dir):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    for prefix in ("a", "b"):
+        at.session_state.report_items = spilled_items(spill_dir, prefix)
+        at.run()
+        click(at, "Add Current Report to Set")
+
+    click(at, "Export Set as ZIP")
+    with zipfile.ZipFile(at.session_state.generated_zip_path) as zf:
+        assert len(zf.namelist()) == 4
+
+
+def test_export_set_failure_removes_partial_zip(spill_dir):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    at.session_state.report_items = spilled_items(spill_dir, "a")
+    at.run()
+    click(at, "Add Current Report to Set")
+    broken = dict(at.session_state.report_set[0], items=spilled_items(spill_dir, "b"))
+    del broken["subtitle"]
+    at.session_state.report_set = at.session_state.report_set + [broken]
+    at.run()
+
+    click(at, "Export Set as ZIP")
+    assert at.error and "export failed" in at.error[0].value
+    assert at.session_state.generated_zip_path is None
+    assert not [f for f in os.listdir(at.session_state.spill_dir.path) if f.endswith(".zip")]
+    assert any("report 2/2" in line for line in at.session_state.debug_log)
+
+
+def test_clear_set_releases_images_and_zip(spill_dir):
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    at.session_state.report_items = spilled_items(spill_dir, "a")
+    at.run()
+    click(at, "Add Current Report to Set")
+    click(at, "Export Set as ZIP")
+    zip_path = at.session_state.generated_zip_path
+    images = [it.image.path for it in at.session_state.report_set[0]["items"]]
+
+    click(at, "Clear Set")
+    assert at.session_state.report_set == []
+    assert at.session_state.generated_zip_path is None
+    assert not os.path.exists(zip_path)
+    assert not any(os.path.exists(p) for p in images)
+
+
+def test_cloned_slide_chrome(spill_dir):
+    from pptx import Presentation
+
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    sizes = [(600, 400), (400, 600), (600, 400), (400, 600)]
+    at.session_state.report_items = ItemStore(
+        ReportItem(f"c{i}", ("Exterior", "Interior")[i % 2], f"Finding {i}", spilled_jpeg(spill_dir, f"c{i}.jpg", w, h))
+        for i, (w, h) in enumerate(sizes)
+    )
+    at.run()
+    click(at, "Generate Report")
+
+    deck = Presentation(at.session_state.generated_ppt_path)
+    header_widths = []
+    for slide in list(deck.slides)[1:]:
+        ids = [shape.shape_id for shape in slide.shapes]
+        assert len(ids) == len(set(ids))
+        header = next(s for s in slide.shapes if s.has_text_frame and s.text_frame.text in ("Exterior", "Interior"))
+        header_widths.append(header.width)
+    # Landscape and portrait pages each keep their own header geometry.
+    assert header_widths[0] == header_widths[2] > header_widths[1] == header_widths[3]
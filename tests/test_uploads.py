@@ -0,0 +1,58 @@
+import io
+import os
+
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_DIR
+
+APP_PATH = os.path.join(REPO_DIR, "app.py")
+
+
+def jpeg_bytes(w, h, color="green"):
+    buf = io.BytesIO()
+    Image.new("RGB", (w, h), color).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def test_batch_uploader_is_cleared_after_adding():
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    files = [(f"p{i}.jpg", jpeg_bytes(60, 40), "image/jpeg") for i in range(3)]
+    at.file_uploader(key="batch_0").set_value(files).run()
+    next(b for b in at.button if b.label == "Add All Batch Images").click().run()
+
+    assert not at.exception
+    assert len(at.session_state.report_items) == 3
+    assert at.session_state.batch_uploader_id == 1
+    # The old widget (and the bytes Streamlit kept for it) is gone.
+    assert [u.key for u in at.file_uploader if u.key.startswith("batch_")] == ["batch_1"]
+
+
+def test_replace_uploader_is_cleared_after_replacing():
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    at.file_uploader(key="batch_0").set_value([("p.jpg", jpeg_bytes(60, 40), "image/jpeg")]).run()
+    next(b for b in at.button if b.label == "Add All Batch Images").click().run()
+    item = at.session_state.report_items[0]
+
+    new_bytes = jpeg_bytes(40, 60, "red")
+    at.file_uploader(key=f"img_{item.id}_0").set_value(("new.jpg", new_bytes, "image/jpeg")).run()
+
+    assert not at.exception
+    assert at.session_state.report_items[0].image.getvalue() == new_bytes
+    assert at.session_state.replace_uploader_id == 1
+    assert f"img_{item.id}_1" in [u.key for u in at.file_uploader]
+
+
+def test_uploads_over_budget_are_spilled(monkeypatch):
+    monkeypatch.setenv("SESSION_MEMORY_BUDGET_MB", "0")
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    files = [(f"p{i}.jpg", jpeg_bytes(60, 40), "image/jpeg") for i in range(2)]
+    at.file_uploader(key="batch_0").set_value(files).run()
+    next(b for b in at.button if b.label == "Add All Batch Images").click().run()
+
+    assert not at.exception
+    assert [type(it.image).__name__ for it in at.session_state.report_items] == ["SpilledImage"] * 2
+    at.session_state.spill_dir.cleanup()
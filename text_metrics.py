@@ -0,0 +1,115 @@
+"""
+Description text measurement and styles, kept out of app.py so their caches outlive
+reruns (Streamlit re-executes app.py into a fresh module each time, see session_store).
+
+Text is measured with bundled Helvetica advance widths, so the editor can check every
+description without importing reportlab. Widths are in 1/1000 em and match reportlab's
+built-in Helvetica AFM metrics for printable Latin-1 and the common WinAnsi
+punctuation. Anything else is measured at reportlab's fallback width for missing glyphs.
+"""
+import functools
+import math
+
+_ASCII = (  # U+0020 .. U+007E
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_LATIN1 = (  # U+00A0 .. U+00FF
+    278, 333, 556, 556, 556, 556, 260, 556, 333, 737, 370, 556, 584, 333, 737, 333,
+    400, 584, 333, 333, 333, 556, 537, 278, 333, 333, 365, 556, 834, 834, 834, 611,
+    667, 667, 667, 667, 667, 667, 1000, 722, 667, 667, 667, 667, 278, 278, 278, 278,
+    722, 722, 778, 778, 778, 778, 778, 584, 778, 722, 722, 722, 722, 667, 667, 611,
+    556, 556, 556, 556, 556, 556, 889, 500, 556, 556, 556, 556, 278, 278, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 584, 611, 556, 556, 556, 556, 500, 556, 500,
+)
+_WINANSI_EXTRA = {
+    "‘": 222, "’": 222, "‚": 222, "“": 333, "”": 333, "„": 333,
+    "–": 556, "—": 1000, "•": 350, "…": 1000, "€": 556, "™": 1000,
+    "†": 556, "‡": 556, "‰": 1000, "‹": 333, "›": 333, "Š": 667,
+    "š": 500, "Œ": 1000, "œ": 944, "Ž": 611, "ž": 500, "Ÿ": 667,
+    "ƒ": 556, "ˆ": 333, "˜": 333,
+}
+MISSING_GLYPH_WIDTH = 761
+
+HELVETICA_WIDTHS = {
+    **{chr(0x20 + i): w for i, w in enumerate(_ASCII)},
+    **{chr(0xA0 + i): w for i, w in enumerate(_LATIN1)},
+    **_WINANSI_EXTRA,
+}
+
+
+def helvetica_width(text, size):
+    """
+    Width of `text` in points when set in Helvetica at `size` pt.
+    """
+    get = HELVETICA_WIDTHS.get
+    return sum(get(ch, MISSING_GLYPH_WIDTH) for ch in text) * size / 1000
+
+
+def count_wrapped_lines(text, width, size):
+    """
+    Greedy word-wrap `text` into `width` points of Helvetica and return the number of lines.
+    Words wider than the box are counted as breaking over several lines.
+    """
+    space = helvetica_width(" ", size)
+    lines = 0
+    for raw_line in text.split("\n"):
+        lines += 1
+        cur = 0.0
+        for word in raw_line.split():
+            ww = helvetica_width(word, size)
+            if ww > width:
+                if cur:
+                    lines += 1
+                extra = math.ceil(ww / width)
+                lines += extra - 1
+                cur = ww - (extra - 1) * width
+            elif not cur:
+                cur = ww
+            elif cur + space + ww <= width:
+                cur += space + ww
+            else:
+                lines += 1
+                cur = ww
+    return lines
+
+
+@functools.lru_cache(maxsize=4096)
+def fit_text(text, box_w, box_h, max_size, leading_ratio, min_size):
+    """
+    Largest whole-point font size in [min_size, max_size] at which `text` fits a
+    box_w x box_h box (points). Returns (size, fits); fits is False when even min_size
+    overflows. Measured once per (text, box) per server process. Helvetica runs slightly
+    wider than PowerPoint's Calibri, so PPT fits err on the safe side.
+    """
+    for size in range(int(max_size), int(min_size) - 1, -1):
+        if count_wrapped_lines(text, box_w, size) * size * leading_ratio <= box_h:
+            return size, True
+    return int(min_size), False
+
+
+@functools.lru_cache(maxsize=None)
+def sample_styles():
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    return getSampleStyleSheet()
+
+
+@functools.lru_cache(maxsize=None)
+def desc_style(font_size, leading_ratio):
+    """
+    Paragraph style for PDF descriptions, derived from the shared "Normal" style
+    (which is never mutated).
+    """
+    from reportlab.lib.styles import ParagraphStyle
+
+    return ParagraphStyle(
+        f"Desc{font_size}",
+        parent=sample_styles()["Normal"],
+        fontSize=font_size,
+        leading=font_size * leading_ratio,
+    )
@@ -0,0 +1,654 @@
+"""
+Load test for app.py: drives many concurrent Streamlit sessions against one server.
+
+Each session opens the app, uploads a synthetic image set through the batch uploader,
+edits a few entries, clicks Generate Report, then edits one more entry and generates
+again. The sessions of a scenario start together; the report gives latency percentiles
+per step, how long the server took to answer a health probe while they ran, the
+server's memory and how many images were spilled to disk.
+
+A scenario can set the app's per-session memory budget (SESSION_MEMORY_BUDGET_MB) low
+enough that uploads go over it, to exercise the spill path and generating from spilled
+images.
+
+Modes:
+- server (default): starts `streamlit run app.py` and connects one headless client per
+  session over Streamlit's websocket protocol and upload endpoint, as browser tabs do.
+  All sessions share the server process, so script threads contend for the GIL and a
+  long Generate delays everyone else's reruns, as in production. Memory is the server's
+  RSS (Linux /proc only). The health probe shows how far the server's event loop is
+  starved while scripts run.
+- process: one AppTest session per process (AppTest isn't safe to drive from several
+  threads of one process). There is no GIL contention between sessions, so latencies
+  are a lower bound, and memory is reported above an idle process. Useful to profile a
+  single session's cost; not a capacity figure for a server.
+
+Usage:
+    python tools/loadtest.py                          # default scenarios
+    python tools/loadtest.py -s 10:25 -s 20:10        # SESSIONS:IMAGES per scenario
+    python tools/loadtest.py -s 5:25:8                # ... with an 8 MB memory budget
+    python tools/loadtest.py -s 4:50 --image-px 3000 --edits 5
+    python tools/loadtest.py --mode process -s 5:10
+"""
+import argparse
+import asyncio
+import io
+import multiprocessing
+import os
+import queue as queue_module
+import resource
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from uuid import uuid4
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_DIR, "app.py")
+DEFAULT_SCENARIOS = ["1:10", "5:10", "10:25", "5:25:8"]
+STEPS = ["open", "upload", "edit", "generate", "regenerate"]
+BUDGET_ENV = "SESSION_MEMORY_BUDGET_MB"
+HEALTH_PROBE_INTERVAL_S = 0.25
+
+
+def make_image_set(n, image_px):
+    """
+    n JPEGs as (name, bytes, mime) uploads, alternating landscape and portrait.
+    Noise keeps them photo-sized on disk.
+    """
+    from PIL import Image
+
+    images = []
+    for i in range(n):
+        w, h = (image_px, image_px * 2 // 3) if i % 2 == 0 else (image_px * 2 // 3, image_px)
+        im = Image.effect_noise((w, h), 64).convert("RGB")
+        buf = io.BytesIO()
+        im.save(buf, format="JPEG", quality=85)
+        images.append((f"photo_{i:04d}.jpg", buf.getvalue(), "image/jpeg"))
+    return images
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile; `values` must be non-empty.
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def edited_text(session_no, n):
+    return f"Finding {n + 1}: session {session_no}, " + "crack in wall. " * 10
+
+
+# --------------------------------------------------
+# Server mode
+# --------------------------------------------------
+class StreamlitServer:
+    """
+    `streamlit run app.py` in a child process. It gets its own TMPDIR, so the
+    sessions' spill dirs can be counted afterwards and are removed on stop().
+    """
+
+    def __init__(self, budget_mb=None, verbose=False):
+        self.tmpdir = tempfile.mkdtemp(prefix="loadtest_")
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{self.port}"
+
+        env = dict(os.environ, TMPDIR=self.tmpdir)
+        if budget_mb is not None:
+            env[BUDGET_ENV] = str(budget_mb)
+        out = None if verbose else subprocess.DEVNULL
+        self.proc = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", APP_PATH,
+                "--server.headless", "true",
+                "--server.port", str(self.port),
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+                "--global.developmentMode", "false",
+            ],
+            cwd=REPO_DIR, env=env, stdout=out, stderr=out,
+        )
+
+    def wait_ready(self, timeout):
+        import requests
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"streamlit exited with code {self.proc.returncode}")
+            try:
+                if requests.get(f"{self.base_url}/_stcore/health", timeout=1).ok:
+                    return
+            except requests.ConnectionError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(f"streamlit not ready after {timeout:.0f}s")
+
+    def memory_mb(self, field):
+        """
+        VmRSS (current) or VmHWM (peak) of the server in MB, or None off Linux.
+        """
+        try:
+            with open(f"/proc/{self.proc.pid}/status") as f:
+                for line in f:
+                    if line.startswith(field + ":"):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+    def spilled_images(self):
+        """
+        Images on disk per session spill dir. Generated reports (report_*) don't count.
+        """
+        counts = []
+        for name in os.listdir(self.tmpdir):
+            if name.startswith("inspection_report_"):
+                files = os.listdir(os.path.join(self.tmpdir, name))
+                counts.append(sum(not f.startswith("report_") for f in files))
+        return counts
+
+    def stop(self):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+class ServerSession:
+    """
+    One headless browser tab. Speaks the frontend's side of the protocol: BackMsg
+    protobufs over the websocket to rerun the script with widget values, ForwardMsg
+    deltas back to find the widgets, and HTTP PUTs for file uploads.
+    """
+
+    def __init__(self, server, timeout):
+        self.server = server
+        self.timeout = timeout
+        self.session_id = None
+        self.widget_states = {}  # widget id -> WidgetState, resent on every rerun like the frontend
+        self.elements = []       # (type, proto) rendered by the last completed script run
+        self.errors = []
+        self._run_elements = []
+        self._run_done = None
+        self._file_urls = {}     # request id -> future for the FileURLsResponse
+
+    async def connect(self):
+        import requests
+        import websockets
+
+        # The health check sets the XSRF cookie that uploads must echo back.
+        self.http = requests.Session()
+        await asyncio.to_thread(self.http.get, f"{self.server.base_url}/_stcore/health")
+        self.ws = await websockets.connect(
+            f"ws://127.0.0.1:{self.server.port}/_stcore/stream",
+            subprotocols=["streamlit"],
+            origin=self.server.base_url,
+            max_size=None,
+        )
+        self._reader = asyncio.create_task(self._read())
+        await self.rerun()
+
+    async def close(self):
+        await self.ws.close()
+        self._reader.cancel()
+        self.http.close()
+
+    async def _read(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        async for data in self.ws:
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.session_id = msg.new_session.initialize.session_id or self.session_id
+                self._run_elements = []
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                el_type = element.WhichOneof("type")
+                self._run_elements.append((el_type, getattr(element, el_type)))
+                if el_type == "exception":
+                    self.errors.append(f"{element.exception.type}: {element.exception.message}")
+            elif kind == "script_finished":
+                # st.rerun() ends a run early and starts the next one; wait for that.
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    self.elements = self._run_elements
+                    if self._run_done is not None and not self._run_done.done():
+                        self._run_done.set_result(msg.script_finished)
+            elif kind == "file_urls_response":
+                fut = self._file_urls.pop(msg.file_urls_response.response_id, None)
+                if fut is not None:
+                    fut.set_result(list(msg.file_urls_response.file_urls))
+
+    async def rerun(self, trigger_id=None):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        back = BackMsg()
+        widgets = back.rerun_script.widget_states.widgets
+        widgets.extend(self.widget_states.values())
+        if trigger_id is not None:
+            trigger = widgets.add()
+            trigger.id = trigger_id
+            trigger.trigger_value = True
+
+        self._run_done = asyncio.get_running_loop().create_future()
+        await self.ws.send(back.SerializeToString())
+        await asyncio.wait_for(self._run_done, self.timeout)
+        if self.errors:
+            raise RuntimeError(self.errors[0])
+
+    def widgets(self, el_type):
+        return [proto for t, proto in self.elements if t == el_type]
+
+    def widget_id(self, el_type, key):
+        # Widgets with a user key get ids ending in "-<key>".
+        return next(w.id for w in self.widgets(el_type) if w.id.endswith(f"-{key}"))
+
+    def expect_downloads(self):
+        if len(self.widgets("download_button")) < 2:
+            raise RuntimeError("Generate Report finished without PPT/PDF download buttons")
+
+    async def click(self, label):
+        button_id = next(w.id for w in self.widgets("button") if w.label == label)
+        await self.rerun(trigger_id=button_id)
+
+    async def set_text(self, widget_id, value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        self.widget_states[widget_id] = WidgetState(id=widget_id, string_value=value)
+        await self.rerun()
+
+    async def upload(self, key, files):
+        """
+        Upload `files` [(name, bytes, mime)] to the file uploader with widget key `key`.
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.Common_pb2 import UploadedFileInfo
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        uploader_id = self.widget_id("file_uploader", key)
+        request_id = uuid4().hex
+        self._file_urls[request_id] = asyncio.get_running_loop().create_future()
+        back = BackMsg()
+        back.file_urls_request.request_id = request_id
+        back.file_urls_request.session_id = self.session_id
+        back.file_urls_request.file_names.extend(name for name, _, _ in files)
+        await self.ws.send(back.SerializeToString())
+        file_urls = await asyncio.wait_for(self._file_urls[request_id], self.timeout)
+
+        state = WidgetState(id=uploader_id)
+        for (name, data, mime), urls in zip(files, file_urls):
+            await asyncio.to_thread(self._put, urls.upload_url, name, data, mime)
+            state.file_uploader_state_value.uploaded_file_info.append(
+                UploadedFileInfo(name=name, size=len(data), file_id=urls.file_id, file_urls=urls)
+            )
+        self.widget_states[uploader_id] = state
+        await self.rerun()
+
+    def _put(self, upload_url, name, data, mime):
+        resp = self.http.put(
+            self.server.base_url + upload_url,
+            files={"file": (name, data, mime)},
+            headers={"X-Xsrftoken": self.http.cookies.get("_streamlit_xsrf")},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+
+
+async def run_server_session(server, session_no, images, n_edits, timeout, timings):
+    """
+    One simulated inspector against `server`; appends step latencies to `timings`.
+    """
+    session = ServerSession(server, timeout)
+
+    async def timed(step, coro):
+        t0 = time.perf_counter()
+        await coro
+        timings[step].append(time.perf_counter() - t0)
+
+    await timed("open", session.connect())
+    try:
+        async def upload():
+            await session.upload("batch_0", images)
+            await session.click("Add All Batch Images")
+
+        await timed("upload", upload())
+        desc_ids = [w.id for w in session.widgets("text_area") if "-desc_" in w.id]
+
+        for e in range(min(n_edits, len(desc_ids))):
+            await timed("edit", session.set_text(desc_ids[e], edited_text(session_no, e)))
+        await timed("generate", session.click("Generate Report"))
+        session.expect_downloads()
+        # Editing clears the generated files; generate again, from spilled images if any.
+        e = min(n_edits, len(desc_ids) - 1)
+        await timed("edit", session.set_text(desc_ids[e], edited_text(session_no, e)))
+        await timed("regenerate", session.click("Generate Report"))
+        session.expect_downloads()
+    finally:
+        await session.close()
+
+
+async def probe_health(server, latencies, stop):
+    import requests
+
+    url = f"{server.base_url}/_stcore/health"
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            await asyncio.to_thread(requests.get, url, timeout=60)
+        except requests.RequestException:
+            pass
+        latencies.append(time.perf_counter() - t0)
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL_S)
+
+
+async def _drive_server_sessions(server, n_sessions, images, n_edits, timeout, timings, errors):
+    health = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_health(server, health, stop))
+    results = await asyncio.gather(
+        *(run_server_session(server, n, images, n_edits, timeout, timings) for n in range(n_sessions)),
+        return_exceptions=True,
+    )
+    stop.set()
+    await probe
+    for n, res in enumerate(results):
+        if isinstance(res, BaseException):
+            errors.append(f"session {n}: {type(res).__name__}: {res}")
+    return health
+
+
+def run_server_scenario(n_sessions, n_images, image_px, n_edits, timeout, budget_mb=None, verbose=False):
+    """
+    Run one scenario against a fresh `streamlit run` server and return its summary dict.
+    `budget_mb` overrides the app's per-session memory budget (default: the app's own).
+    """
+    images = make_image_set(n_images, image_px)
+    server = StreamlitServer(budget_mb, verbose)
+    try:
+        server.wait_ready(timeout)
+        idle_mb = server.memory_mb("VmRSS")
+        timings = {step: [] for step in STEPS}
+        errors = []
+        t0 = time.perf_counter()
+        health = asyncio.run(
+            _drive_server_sessions(server, n_sessions, images, n_edits, timeout, timings, errors)
+        )
+        wall = time.perf_counter() - t0
+        peak_mb = server.memory_mb("VmHWM")
+        spilled = server.spilled_images()
+    finally:
+        server.stop()
+
+    return {
+        "mode": "server",
+        "sessions": n_sessions,
+        "images": n_images,
+        "budget_mb": budget_mb,
+        "spilled": spilled + [0] * (n_sessions - len(spilled)),
+        "wall_s": wall,
+        "server_idle_mb": idle_mb,
+        "server_peak_mb": peak_mb,
+        "health_s": health,
+        "timings": timings,
+        "errors": errors,
+    }
+
+
+# --------------------------------------------------
+# Process mode
+# --------------------------------------------------
+def run_session(session_no, n_images, image_px, n_edits, timeout, start_barrier=None):
+    """
+    One simulated inspector under AppTest. Returns ({step: [latency_s, ...]}, n_spilled)
+    or raises on app errors. Waits on `start_barrier` (if given) once its images are
+    ready, so sessions load the app at the same time.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, REPO_DIR)
+    from session_store import SpilledImage
+
+    timings = {step: [] for step in STEPS}
+
+    def timed(step, fn):
+        t0 = time.perf_counter()
+        fn()
+        timings[step].append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"{step}: {at.exception[0].value}")
+
+    images = make_image_set(n_images, image_px)
+    if start_barrier is not None:
+        start_barrier.wait()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    timed("open", at.run)
+
+    at.file_uploader(key="batch_0").set_value(images).run()
+    add_batch = next(b for b in at.button if b.label == "Add All Batch Images")
+    timed("upload", lambda: add_batch.click().run())
+    item_ids = [it.id for it in at.session_state.report_items]
+
+    def edit(n):
+        at.text_area(key=f"desc_{item_ids[n]}").set_value(edited_text(session_no, n)).run()
+
+    for e in range(min(n_edits, n_images)):
+        timed("edit", lambda: edit(e))
+
+    def click_generate():
+        next(b for b in at.button if b.label == "Generate Report").click().run()
+
+    timed("generate", click_generate)
+    # Editing clears the generated files; generate again, from spilled images if any.
+    timed("edit", lambda: edit(min(n_edits, n_images - 1)))
+    timed("regenerate", click_generate)
+
+    n_spilled = sum(isinstance(it.image, SpilledImage) for it in at.session_state.report_items)
+    return timings, n_spilled
+
+
+def _idle_child(timeout, results):
+    sys.stderr = open(os.devnull, "w")
+    try:
+        from streamlit.testing.v1 import AppTest
+
+        AppTest.from_file(APP_PATH, default_timeout=timeout).run()
+        import pptx  # noqa: F401
+        import PIL.Image  # noqa: F401
+        import pypdfium2  # noqa: F401
+        import reportlab.pdfgen.canvas  # noqa: F401
+        import reportlab.platypus  # noqa: F401
+    finally:
+        results.put(peak_rss_mb())
+
+
+def measure_idle_rss(timeout):
+    """
+    Peak RSS (MB) of a process that has opened the app once and imported the rendering
+    stack but holds no session data: the fixed cost every session process repeats.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    proc = ctx.Process(target=_idle_child, args=(timeout, results))
+    proc.start()
+    rss = results.get(timeout=timeout)
+    proc.join()
+    return rss
+
+
+def _session_child(session_no, args, budget_mb, start_barrier, results, verbose):
+    if not verbose:
+        # Streamlit logs at debug level under AppTest; errors come back through `results`.
+        sys.stderr = open(os.devnull, "w")
+    if budget_mb is not None:
+        os.environ[BUDGET_ENV] = str(budget_mb)
+    try:
+        timings, n_spilled = run_session(session_no, *args, start_barrier=start_barrier)
+        results.put((session_no, timings, n_spilled, peak_rss_mb(), None))
+    except Exception as e:
+        results.put((session_no, None, 0, peak_rss_mb(), f"{type(e).__name__}: {e}"))
+
+
+def run_process_scenario(n_sessions, n_images, image_px, n_edits, timeout, budget_mb=None, verbose=False):
+    """
+    Run one scenario, one AppTest process per session, and return its summary dict.
+    Session memory is reported above an idle process (see measure_idle_rss).
+    """
+    idle_rss_mb = measure_idle_rss(timeout)
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    start_barrier = ctx.Barrier(n_sessions, timeout=timeout)
+    procs = [
+        ctx.Process(
+            target=_session_child,
+            args=(n, (n_images, image_px, n_edits, timeout), budget_mb, start_barrier, results, verbose),
+        )
+        for n in range(n_sessions)
+    ]
+
+    t0 = time.perf_counter()
+    for proc in procs:
+        proc.start()
+
+    timings = {step: [] for step in STEPS}
+    session_rss = []
+    spilled = []
+    errors = []
+    pending = set(range(n_sessions))
+    while pending:
+        try:
+            session_no, result, n_spilled, rss, error = results.get(timeout=1)
+        except queue_module.Empty:
+            for n, proc in enumerate(procs):
+                if n in pending and not proc.is_alive():
+                    pending.discard(n)
+                    errors.append(f"session {n}: process died (exit code {proc.exitcode})")
+            continue
+        pending.discard(session_no)
+        session_rss.append(max(0.0, rss - idle_rss_mb))
+        if error:
+            errors.append(f"session {session_no}: {error}")
+        else:
+            spilled.append(n_spilled)
+            for step, values in result.items():
+                timings[step].extend(values)
+    wall = time.perf_counter() - t0
+
+    for proc in procs:
+        proc.join()
+
+    return {
+        "mode": "process",
+        "sessions": n_sessions,
+        "images": n_images,
+        "budget_mb": budget_mb,
+        "spilled": spilled,
+        "wall_s": wall,
+        "idle_rss_mb": idle_rss_mb,
+        "session_peak_mb": max(session_rss, default=0.0),
+        "sessions_total_mb": sum(session_rss),
+        "timings": timings,
+        "errors": errors,
+    }
+
+
+# --------------------------------------------------
+# Report
+# --------------------------------------------------
+def print_latency_row(name, values):
+    cols = [percentile(values, p) for p in (50, 90, 99)] + [max(values)]
+    print(f"{name:<10}{len(values):>6}" + "".join(f"{v:>9.2f}s" for v in cols))
+
+
+def print_report(result):
+    budget = f", budget {result['budget_mb']:g} MB" if result["budget_mb"] is not None else ""
+    print(
+        f"\n=== {result['mode']} mode: {result['sessions']} session(s) x {result['images']} image(s){budget} "
+        f"- wall {result['wall_s']:.1f}s ==="
+    )
+    if result["mode"] == "server":
+        if result["server_peak_mb"] is not None:
+            print(
+                f"server RSS: {result['server_idle_mb']:.0f} MB idle, {result['server_peak_mb']:.0f} MB peak "
+                f"(+{result['server_peak_mb'] - result['server_idle_mb']:.0f} MB for {result['sessions']} session(s))"
+            )
+        else:
+            print("server RSS: n/a (needs Linux /proc)")
+    else:
+        print(
+            f"RSS above idle process ({result['idle_rss_mb']:.0f} MB): "
+            f"{result['session_peak_mb']:.0f} MB peak/session, {result['sessions_total_mb']:.0f} MB all sessions "
+            "(one process per session, not a server capacity figure)"
+        )
+    if result["spilled"]:
+        print(f"spilled to disk: {min(result['spilled'])}-{max(result['spilled'])} of {result['images']} images per session")
+    print(f"{'step':<10}{'n':>6}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for step in STEPS:
+        if result["timings"][step]:
+            print_latency_row(step, result["timings"][step])
+    if result.get("health_s"):
+        print_latency_row("health", result["health_s"])
+    for err in result["errors"]:
+        print(f"ERROR: {err}")
+
+
+def parse_scenario(text):
+    """
+    "SESSIONS:IMAGES" or "SESSIONS:IMAGES:BUDGET_MB" -> (sessions, images, budget_mb or None).
+    """
+    parts = text.split(":")
+    try:
+        if len(parts) not in (2, 3):
+            raise ValueError
+        sessions, images = int(parts[0]), int(parts[1])
+        budget_mb = float(parts[2]) if len(parts) == 3 else None
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected SESSIONS:IMAGES[:BUDGET_MB], got {text!r}")
+    if sessions < 1 or images < 1:
+        raise argparse.ArgumentTypeError("SESSIONS and IMAGES must be >= 1")
+    if budget_mb is not None and budget_mb <= 0:
+        raise argparse.ArgumentTypeError("BUDGET_MB must be > 0")
+    return sessions, images, budget_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent sessions against app.py.")
+    parser.add_argument("-s", "--scenario", action="append", type=parse_scenario,
+                        help="SESSIONS:IMAGES[:BUDGET_MB], repeatable (default: %s)" % " ".join(DEFAULT_SCENARIOS))
+    parser.add_argument("--mode", choices=["server", "process"], default="server",
+                        help="sessions on one streamlit server (default) or one AppTest process each")
+    parser.add_argument("--image-px", type=int, default=1600, help="long edge of synthetic photos (default 1600)")
+    parser.add_argument("--edits", type=int, default=3, help="description edits per session (default 3)")
+    parser.add_argument("--timeout", type=float, default=600, help="per-rerun timeout in seconds (default 600)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show Streamlit logs from the server/sessions")
+    args = parser.parse_args()
+
+    run_scenario = run_server_scenario if args.mode == "server" else run_process_scenario
+    scenarios = args.scenario or [parse_scenario(s) for s in DEFAULT_SCENARIOS]
+    failed = False
+    for sessions, images, budget_mb in scenarios:
+        result = run_scenario(sessions, images, args.image_px, args.edits, args.timeout, budget_mb, args.verbose)
+        print_report(result)
+        failed = failed or bool(result["errors"])
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()